@@ -4,9 +4,12 @@
 #include <time.h>
 #include <unistd.h>
 
+#define STOCK_COUNT 20
+#define RAND_SCALE (1.0 / RAND_MAX)
+
 typedef struct stock
 {
-    char *symbol;
+    char symbol[5];
     double price;
     int quantity;
 } Stock;
@@ -15,19 +18,20 @@ char *randomSymbolCreator(char *symbol);
 
 double randomPriceGenerator();
 double updatePrice(double price);
-double calcNetWorth(Stock *stocks, double netWorth, double cash);
+double calcNetWorth(Stock *stocks, double cash);
+double calculateTotalStocksValue(Stock *stocks);
 
 void initializeStockMarket(Stock *stocks);
 void initializeApp();
-void freeMemory(Stock *stocks, int size);
 void listStocks(Stock *stocks);
 void choosesPrinter();
-void calculateTotalStocksValue(Stock *stocks);
+
+Stock *findStock(Stock *stocks, char *symbol);
 
 int main()
 {
-    Stock stocks[20];
-    double cash = 5000, netWorth;
+    Stock stocks[STOCK_COUNT];
+    double cash = 5000, netWorth, stocksValue;
     int quarter = 1, year = 2023, age, yearLeft = 20;
     char name[20];
     initializeApp();
@@ -38,7 +42,8 @@ int main()
     scanf("%d", &age);
     printf("What's your name: ");
     scanf("%s", name);
-    char *inputStock = (char *)malloc(5 * sizeof(char));
+    char inputStock[6];
+    Stock *stock;
     while (1)
     {
         if (quarter >= 5)
@@ -49,7 +54,7 @@ int main()
             yearLeft -= 1;
         }
         usleep(250000);
-        netWorth = calcNetWorth(stocks, netWorth, cash);
+        netWorth = calcNetWorth(stocks, cash);
         if (yearLeft > 0)
         {
             printf("\nHello %s.We are in the Q%d of %d and you are %d. You have %d years left to reach 10 million dollars.\n", name, quarter, year, age, yearLeft);
@@ -70,12 +75,13 @@ int main()
 
     here:
         usleep(250000);
+        stocksValue = calculateTotalStocksValue(stocks);
+        netWorth = cash + stocksValue;
         printf("Net Worth: $%.2lf", netWorth);
         usleep(250000);
         printf("\t\tCASH: $%.2lf", cash);
         usleep(250000);
-        calculateTotalStocksValue(stocks);
-        printf("\n");
+        printf("\t\tTotal value of stocks: %s$%.2lf\n\n", stocksValue < 0 ? "-" : "", stocksValue < 0 ? -stocksValue : stocksValue);
         choosesPrinter();
         int choice;
         scanf("%d", &choice);
@@ -88,40 +94,35 @@ int main()
         case 2:
             listStocks(stocks);
             printf("\n\nEnter the symbol of the stock: ");
-            scanf("%s", inputStock);
-            inputStock[5] = '\0';
-            for (int i = 0; i < 20; i++)
+            scanf("%5s%*[^ \t\n]", inputStock);
+            stock = findStock(stocks, inputStock);
+            if (stock != NULL)
             {
-                if (strcmp(inputStock, stocks[i].symbol) == 0)
+                int num = 0;
+                printf("\tHow many stock do you want to buy: ");
+                scanf("%d", &num);
+                double cost = num * stock->price;
+                if (cash >= cost)
                 {
-                    int num = 0;
-                    printf("\tHow many stock do you want to buy: ");
-                    scanf("%d", &num);
-                    if (cash >= num * stocks[i].price)
-                    {
-                        stocks[i].quantity += num;
-                        cash -= num * stocks[i].price;
-                    }
-                    else
-                        printf("\nYou don't have enough money for this. Sell some stocks first!\n");
+                    stock->quantity += num;
+                    cash -= cost;
                 }
+                else
+                    printf("\nYou don't have enough money for this. Sell some stocks first!\n");
             }
             break;
         case 3:
             listStocks(stocks);
             printf("\n\nEnter the symbol of the stock: ");
-            scanf("%s", inputStock);
-            inputStock[5] = '\0';
-            for (int i = 0; i < 20; i++)
+            scanf("%5s%*[^ \t\n]", inputStock);
+            stock = findStock(stocks, inputStock);
+            if (stock != NULL)
             {
-                if (strcmp(inputStock, stocks[i].symbol) == 0)
-                {
-                    int num = 0;
-                    printf("\tHow many stock do you want to sell: ");
-                    scanf("%d", &num);
-                    stocks[i].quantity -= num;
-                    cash += num * stocks[i].price;
-                }
+                int num = 0;
+                printf("\tHow many stock do you want to sell: ");
+                scanf("%d", &num);
+                stock->quantity -= num;
+                cash += num * stock->price;
             }
 
             break;
@@ -135,7 +136,7 @@ int main()
         scanf("%d", &check);
         if (check == 1)
         {
-            for (int i = 0; i < 20; i++)
+            for (int i = 0; i < STOCK_COUNT; i++)
             {
                 stocks[i].price = updatePrice(stocks[i].price);
             }
@@ -146,14 +147,12 @@ int main()
         else
             goto here;
     }
-    free(inputStock);
-    freeMemory(stocks, 20);
     return 0;
 }
 
 void listStocks(Stock *stocks)
 {
-    for (int i = 0; i < 20; i++)
+    for (int i = 0; i < STOCK_COUNT; i++)
     {
         printf("\n%s | %.2lf | %d", stocks[i].symbol, stocks[i].price, stocks[i].quantity);
     }
@@ -162,25 +161,35 @@ void listStocks(Stock *stocks)
 
 void choosesPrinter()
 {
-    printf("******************");
-    printf("\nWhat would you like to do?\n");
-    printf("1. View stocks\n");
-    printf("2. Buy stocks\n");
-    printf("3. Sell stocks\n");
-    printf("******************\n\n");
+    fputs("******************"
+          "\nWhat would you like to do?\n"
+          "1. View stocks\n"
+          "2. Buy stocks\n"
+          "3. Sell stocks\n"
+          "******************\n\n",
+          stdout);
 }
 
-void calculateTotalStocksValue(Stock *stocks)
+Stock *findStock(Stock *stocks, char *symbol)
 {
-    double totalValue = 0;
-    for (int i = 0; i < 20; i++)
+    for (int i = 0; i < STOCK_COUNT; i++)
     {
-        for (int j = 0; j < stocks[i].quantity; j++)
+        if (strcmp(symbol, stocks[i].symbol) == 0)
         {
-            totalValue += stocks[i].price;
+            return &stocks[i];
         }
     }
-    printf("\t\tTotal value of stocks: $%.2lf\n", totalValue);
+    return NULL;
+}
+
+double calculateTotalStocksValue(Stock *stocks)
+{
+    double totalValue = 0;
+    for (int i = 0; i < STOCK_COUNT; i++)
+    {
+        totalValue += stocks[i].price * stocks[i].quantity;
+    }
+    return totalValue;
 }
 
 void initializeApp()
@@ -202,9 +211,8 @@ void initializeApp()
 
 void initializeStockMarket(Stock *stocks)
 {
-    for (int i = 0; i < 20; i++)
+    for (int i = 0; i < STOCK_COUNT; i++)
     {
-        stocks[i].symbol = (char *)malloc(5 * sizeof(char));
         randomSymbolCreator(stocks[i].symbol);
         stocks[i].symbol[4] = '\0';
         stocks[i].price = randomPriceGenerator();
@@ -223,34 +231,17 @@ char *randomSymbolCreator(char *symbol)
 
 double randomPriceGenerator()
 {
-    return (double)rand() / RAND_MAX * 100;
-}
-
-void freeMemory(Stock *stocks, int size)
-{
-    for (int i = 0; i < size; i++)
-    {
-        free(stocks[i].symbol);
-        stocks[i].symbol = NULL;
-    }
+    return rand() * RAND_SCALE * 100;
 }
 
 double updatePrice(double price)
 {
-    double randNum = (double)rand() / RAND_MAX; // 0 ile 1 arasında rastgele sayı
+    double randNum = rand() * RAND_SCALE;       // 0 ile 1 arasında rastgele sayı
     randNum = randNum * 1.5 - 0.5;              // -0.5 ile 1 arasında sayı elde etmek için
     return (double)price * (randNum + 1);
 }
 
-double calcNetWorth(Stock *stocks, double netWorth, double cash)
+double calcNetWorth(Stock *stocks, double cash)
 {
-    netWorth = cash;
-    for (int i = 0; i < 20; i++)
-    {
-        if (stocks[i].quantity != 0)
-        {
-            netWorth += stocks[i].price * stocks[i].quantity;
-        }
-    }
-    return netWorth;
+    return cash + calculateTotalStocksValue(stocks);
 }
\ No newline at end of file